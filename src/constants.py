@@ -16,6 +16,11 @@ DEFAULT_REMOTE_URL_DOCKER = "http://selenium:4444"  # Docker環境用
 DEFAULT_REMOTE_URL_LOCAL = "http://localhost:4444"  # ローカル環境用
 DEFAULT_REMOTE_URL_BROWSERLESS = "wss://chrome.browserless.io"  # Browserless.io用
 DEFAULT_TIMEOUT = 10  # 秒
+DEFAULT_POLL_FREQUENCY = 0.1  # 要素待機のポーリング間隔 (秒)
+FAST_WAIT_TIMEOUT = 5  # 静的ページの要素待機用の短いタイムアウト (秒)
+
+# HTTP接続プール設定 (urllib3)
+HTTP_POOL_MAXSIZE = 10  # 同時コマンド用の接続数
 
 # サポートブラウザ
 SUPPORTED_BROWSERS = ["chrome", "firefox"]
@@ -31,6 +36,9 @@ TEST_URL = "https://httpbin.org/html"
 RAILWAY_ENVIRONMENT = "RAILWAY_ENVIRONMENT"
 RAILWAY_PROJECT_ID = "RAILWAY_PROJECT_ID"
 
+# Docker環境検出用
+ENV_DOCKER_CONTAINER = "DOCKER_CONTAINER"
+
 # ========================================
 # Browser Options
 # ========================================
@@ -63,6 +71,9 @@ VNC_URL = "http://localhost:7900"  # VNC接続URL
 # ログレベル
 DEFAULT_LOG_LEVEL = logging.INFO
 
+# ログ出力形式 (color: ANSI色付き / json: ログ収集基盤向け構造化出力)
+DEFAULT_LOG_FORMAT = "color"
+
 # ANSI色コード
 LOG_COLORS = {
     "DEBUG": "\033[36m",  # シアン
@@ -109,4 +120,5 @@ SCREENSHOT_SAVED_MSG = "Screenshot saved: {}"
 
 ENV_SELENIUM_BROWSER = "SELENIUM_BROWSER"
 ENV_SELENIUM_REMOTE_URL = "SELENIUM_REMOTE_URL"
+ENV_LOG_FORMAT = "LOG_FORMAT"  # ログ出力形式 (color/json)
 ENV_BROWSERLESS_TOKEN = "BROWSERLESS_TOKEN"  # Browserless.io APIトークン
@@ -4,14 +4,19 @@ Selenium Standalone Chromium Scraper
 Remote WebDriver with Standalone Chromium を使用したウェブスクレイピング機能
 """
 
+from __future__ import annotations
+
+import logging
 import os
+from typing import TYPE_CHECKING
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.common.by import By
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+# Selenium の import ツリーは重いため、実際に使うメソッド内まで遅延させる
+# (コールドスタート時の import 時間を削減)
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.firefox.options import Options as FirefoxOptions
 
 from src.constants import (
     CHROME_USER_AGENT,
@@ -19,15 +24,19 @@ from src.constants import (
     CONNECTION_FAILED_MSG,
     CONNECTION_SUCCESS_MSG,
     DEFAULT_BROWSER,
+    DEFAULT_POLL_FREQUENCY,
     DEFAULT_REMOTE_URL_BROWSERLESS,
     DEFAULT_REMOTE_URL_DOCKER,
     DEFAULT_REMOTE_URL_LOCAL,
     DEFAULT_SCREENSHOT_DIR,
     DEFAULT_TIMEOUT,
+    ENV_DOCKER_CONTAINER,
     ENV_SELENIUM_BROWSER,
     ENV_SELENIUM_REMOTE_URL,
+    FAST_WAIT_TIMEOUT,
     FIREFOX_WINDOW_HEIGHT,
     FIREFOX_WINDOW_WIDTH,
+    HTTP_POOL_MAXSIZE,
     RAILWAY_ENVIRONMENT,
     RAILWAY_PROJECT_ID,
     SCREENSHOT_SAVED_MSG,
@@ -38,6 +47,84 @@ from src.constants import (
 )
 from src.utils.logger import get_app_logger
 
+# 環境変数はプロセス中に変化しないため import 時に一度だけ読む
+if os.getenv(RAILWAY_ENVIRONMENT) or os.getenv(RAILWAY_PROJECT_ID):
+    # Railway環境: Browserless.ioまたは外部サービスを使用
+    _ENV_DEFAULT_REMOTE_URL = DEFAULT_REMOTE_URL_BROWSERLESS
+elif os.getenv(ENV_DOCKER_CONTAINER):
+    # Docker環境: selenium サービスを使用
+    _ENV_DEFAULT_REMOTE_URL = DEFAULT_REMOTE_URL_DOCKER
+else:
+    # ローカル環境: localhost を使用
+    _ENV_DEFAULT_REMOTE_URL = DEFAULT_REMOTE_URL_LOCAL
+
+_ENV_BROWSER = os.getenv(ENV_SELENIUM_BROWSER, DEFAULT_BROWSER)
+_ENV_REMOTE_URL = os.getenv(ENV_SELENIUM_REMOTE_URL, _ENV_DEFAULT_REMOTE_URL)
+
+# ページ情報をブラウザ側で1回にまとめて収集するスクリプト
+# (/title /url /source /element /text の5エンドポイント分の往復を /execute/sync 1回に融合)
+_PAGE_SUMMARY_SCRIPT = """
+const h1 = document.querySelector('h1');
+return {
+    title: document.title,
+    url: location.href,
+    h1: h1 ? h1.innerText : 'N/A',
+    len: document.documentElement.outerHTML.length
+};
+"""
+
+# ブラウザ起動引数は不変なため import 時に一度だけ組み立てる (f-string 評価を接続ごとに繰り返さない)
+_CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--force-device-scale-factor=1",
+    f"--window-size={CHROME_WINDOW_SIZE}",
+    f"--user-agent={CHROME_USER_AGENT}",
+)
+_FIREFOX_ARGS = (
+    f"--width={FIREFOX_WINDOW_WIDTH}",
+    f"--height={FIREFOX_WINDOW_HEIGHT}",
+)
+
+# Grid URL ごとの ClientConfig キャッシュ (再接続・複数スクレイパーで設定を共有)
+_client_config_cache: dict[str, object] = {}
+
+
+def _client_config_for(grid_url: str):
+    """Grid URL 単位で接続プール設定をメモ化して返す"""
+    config = _client_config_cache.get(grid_url)
+    if config is None:
+        from selenium.webdriver.remote.client_config import ClientConfig
+
+        # keep-alive + 複数コマンド同時実行に耐えるプールサイズ
+        config = ClientConfig(
+            remote_server_addr=grid_url,
+            keep_alive=True,
+            init_args_for_pool_manager={"init_args_for_pool_manager": {"maxsize": HTTP_POOL_MAXSIZE, "block": False}},
+        )
+        _client_config_cache[grid_url] = config
+    return config
+
+
+# 作成済みスクリーンショットディレクトリ (2回目以降の makedirs システムコールを省く)
+_ENSURED_DIRS: set[str] = set()
+
+# 待機条件はロケータに対して不変なため、呼び出しごとの生成を避けてメモ化する
+_condition_cache: dict[tuple[str, str], object] = {}
+
+
+def _presence_condition(by: By, value: str):
+    """presence_of_element_located 条件をロケータ単位でメモ化して返す"""
+    key = (by, value)
+    condition = _condition_cache.get(key)
+    if condition is None:
+        from selenium.webdriver.support import expected_conditions as EC
+
+        condition = EC.presence_of_element_located(key)
+        _condition_cache[key] = condition
+    return condition
+
 
 class StandaloneChromiumScraper:
     """Selenium Standalone Chromium を使用したWebDriver管理クラス"""
@@ -56,48 +143,62 @@ class StandaloneChromiumScraper:
         self.timeout = timeout
         self.driver: webdriver.Remote | None = None
         self.logger = get_app_logger(__name__)
+        # ブラウザ情報キャッシュ (セッション中は不変のため connect() で一度だけ取得)
+        self._browser_name = "unknown"
+        self._browser_version = "unknown"
+        # 既定タイムアウト用の WebDriverWait (connect() で生成して再利用)
+        self._wait = None
 
     def _create_chrome_options(self) -> ChromeOptions:
         """Chrome用オプションを作成"""
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+
         options = ChromeOptions()
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument(f"--window-size={CHROME_WINDOW_SIZE}")
-        options.add_argument(f"--user-agent={CHROME_USER_AGENT}")
+        for arg in _CHROME_ARGS:
+            options.add_argument(arg)
         return options
 
     def _create_firefox_options(self) -> FirefoxOptions:
         """Firefox用オプションを作成"""
+        from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
         options = FirefoxOptions()
-        options.add_argument(f"--width={FIREFOX_WINDOW_WIDTH}")
-        options.add_argument(f"--height={FIREFOX_WINDOW_HEIGHT}")
+        for arg in _FIREFOX_ARGS:
+            options.add_argument(arg)
         return options
 
     def connect(self) -> None:
         """Remote WebDriver に接続"""
-        self.logger.info(f"Connecting to Selenium Standalone {self.browser.title()}...")
+        from selenium import webdriver
+
+        self.logger.info("Connecting to Selenium Standalone %s...", self.browser.title())
 
         try:
             grid_url = f"{self.remote_url}/wd/hub"
+            client_config = _client_config_for(grid_url)
 
             if self.browser == "chrome":
                 options = self._create_chrome_options()
-                self.driver = webdriver.Remote(command_executor=grid_url, options=options)
+                self.driver = webdriver.Remote(command_executor=grid_url, options=options, client_config=client_config)
 
             elif self.browser == "firefox":
                 options = self._create_firefox_options()
-                self.driver = webdriver.Remote(command_executor=grid_url, options=options)
+                self.driver = webdriver.Remote(command_executor=grid_url, options=options, client_config=client_config)
 
             else:
                 supported_str = "', '".join(SUPPORTED_BROWSERS)
                 raise ValueError(UNSUPPORTED_BROWSER_MSG.format(self.browser, f"'{supported_str}'"))
 
-            # 接続確認
-            browser_name = self.driver.capabilities.get("browserName", "unknown")
-            browser_version = self.driver.capabilities.get("browserVersion", "unknown")
+            # 既定タイムアウトの待機オブジェクトはセッション中再利用できる
+            from selenium.webdriver.support.ui import WebDriverWait
+
+            self._wait = WebDriverWait(self.driver, self.timeout, poll_frequency=DEFAULT_POLL_FREQUENCY)
+
+            # 接続確認 (capabilities はセッション中不変なのでここでキャッシュ)
+            self._browser_name = self.driver.capabilities.get("browserName", "unknown")
+            self._browser_version = self.driver.capabilities.get("browserVersion", "unknown")
 
-            self.logger.info(CONNECTION_SUCCESS_MSG.format(browser_name, browser_version))
+            self.logger.info(CONNECTION_SUCCESS_MSG.format(self._browser_name, self._browser_version))
 
         except Exception as e:
             self.logger.error(CONNECTION_FAILED_MSG.format(e))
@@ -110,9 +211,10 @@ class StandaloneChromiumScraper:
                 self.driver.quit()
                 self.logger.info("Remote WebDriver disconnected")
             except Exception as e:
-                self.logger.warning(f"Error during disconnect: {e}")
+                self.logger.warning("Error during disconnect: %s", e)
             finally:
                 self.driver = None
+                self._wait = None
 
     def __enter__(self):
         """Context manager entry"""
@@ -123,98 +225,118 @@ class StandaloneChromiumScraper:
         """Context manager exit"""
         self.disconnect()
 
+    def _require_driver(self) -> webdriver.Remote:
+        """接続済みドライバーを返す（未接続なら RuntimeError）"""
+        driver = self.driver
+        if driver is None:
+            raise RuntimeError(WEBDRIVER_NOT_CONNECTED_MSG)
+        return driver
+
     def get_page(self, url: str) -> None:
         """指定URLのページを取得"""
-        if not self.driver:
-            raise RuntimeError(WEBDRIVER_NOT_CONNECTED_MSG)
+        driver = self._require_driver()
+        self.logger.info("Navigating to: %s", url)
+        driver.get(url)
 
-        self.logger.info(f"Navigating to: {url}")
-        self.driver.get(url)
+    def wait_for_element(self, by: By, value: str, timeout: int | None = None):
+        """要素の出現を待機し、見つかった要素を返す"""
+        driver = self._require_driver()
+        condition = _presence_condition(by, value)
 
-    def wait_for_element(self, by: By, value: str, timeout: int = None) -> None:
-        """要素の出現を待機"""
-        if not self.driver:
-            raise RuntimeError(WEBDRIVER_NOT_CONNECTED_MSG)
+        # 既定タイムアウトならキャッシュ済み WebDriverWait を再利用
+        if timeout is None and self._wait is not None:
+            return self._wait.until(condition)
+
+        from selenium.webdriver.support.ui import WebDriverWait
 
         wait_timeout = timeout or self.timeout
-        WebDriverWait(self.driver, wait_timeout).until(EC.presence_of_element_located((by, value)))
+        return WebDriverWait(driver, wait_timeout, poll_frequency=DEFAULT_POLL_FREQUENCY).until(condition)
 
     def find_element(self, by: By, value: str):
         """要素を検索"""
-        if not self.driver:
-            raise RuntimeError(WEBDRIVER_NOT_CONNECTED_MSG)
-
-        return self.driver.find_element(by, value)
+        return self._require_driver().find_element(by, value)
 
     def find_elements(self, by: By, value: str):
         """複数要素を検索"""
-        if not self.driver:
-            raise RuntimeError(WEBDRIVER_NOT_CONNECTED_MSG)
+        return self._require_driver().find_elements(by, value)
 
-        return self.driver.find_elements(by, value)
+    def get_page_info(self, include_source_length: bool = False) -> dict[str, str]:
+        """
+        現在のページの基本情報を取得
 
-    def get_page_info(self) -> dict[str, str]:
-        """現在のページの基本情報を取得"""
-        if not self.driver:
-            raise RuntimeError(WEBDRIVER_NOT_CONNECTED_MSG)
+        Args:
+            include_source_length: ページソース長を含めるか (HTML全体の転送が発生するため既定は無効)
+        """
+        driver = self._require_driver()
+
+        info = {
+            "title": driver.title,
+            "current_url": driver.current_url,
+            "browser_name": self._browser_name,
+            "browser_version": self._browser_version,
+        }
+
+        if include_source_length:
+            # ブラウザ側で長さだけ計算し、HTML全体の転送を避ける
+            info["page_source_length"] = str(driver.execute_script("return document.documentElement.outerHTML.length"))
 
-        # ブラウザ情報
-        browser_name = self.driver.capabilities.get("browserName", "unknown")
-        browser_version = self.driver.capabilities.get("browserVersion", "unknown")
+        return info
+
+    def get_page_summary(self) -> dict[str, str]:
+        """ページ情報を1回の execute_script でまとめて取得 (コマンド往復の削減)"""
+        driver = self._require_driver()
+        summary = driver.execute_script(_PAGE_SUMMARY_SCRIPT)
 
         return {
-            "title": self.driver.title,
-            "current_url": self.driver.current_url,
-            "page_source_length": str(len(self.driver.page_source)),
-            "browser_name": browser_name,
-            "browser_version": browser_version,
+            "title": summary["title"],
+            "current_url": summary["url"],
+            "h1_text": summary["h1"],
+            "page_source_length": str(summary["len"]),
+            "browser_name": self._browser_name,
+            "browser_version": self._browser_version,
         }
 
     def take_screenshot(self, filename: str = "screenshot.png", directory: str = DEFAULT_SCREENSHOT_DIR) -> str:
         """スクリーンショットを保存"""
-        if not self.driver:
-            raise RuntimeError(WEBDRIVER_NOT_CONNECTED_MSG)
+        driver = self._require_driver()
 
-        # ディレクトリ作成
-        os.makedirs(directory, exist_ok=True)
+        # ディレクトリ作成 (一度確認したディレクトリはスキップ)
+        if directory not in _ENSURED_DIRS:
+            os.makedirs(directory, exist_ok=True)
+            _ENSURED_DIRS.add(directory)
 
         filepath = os.path.join(directory, filename)
 
         try:
-            self.driver.save_screenshot(filepath)
+            driver.save_screenshot(filepath)
             self.logger.info(SCREENSHOT_SAVED_MSG.format(filepath))
             return filepath
         except Exception as e:
-            self.logger.error(f"Failed to save screenshot: {e}")
+            self.logger.error("Failed to save screenshot: %s", e)
             raise
 
 
 def scrape_test_page(scraper: StandaloneChromiumScraper) -> dict[str, str]:
     """テストページをスクレイピング（クラス外関数）"""
+    from selenium.webdriver.common.by import By
+
     logger = get_app_logger(__name__)
 
     try:
         # テストページに移動
         scraper.get_page(TEST_URL)
 
-        # ページロード待機
-        scraper.wait_for_element(By.TAG_NAME, "h1")
+        # ページロード待機 (静的ページなので短いタイムアウトで十分)
+        scraper.wait_for_element(By.TAG_NAME, "h1", timeout=FAST_WAIT_TIMEOUT)
 
-        # 基本ページ情報取得
-        page_info = scraper.get_page_info()
-
-        # H1テキスト取得
-        try:
-            h1_element = scraper.find_element(By.TAG_NAME, "h1")
-            h1_text = h1_element.text
-        except Exception:
-            h1_text = "N/A"
+        # ページ情報を1往復でまとめて取得
+        page_info = scraper.get_page_summary()
 
         # 結果をまとめる
         result = {
             "status": "success",
             "title": page_info["title"],
-            "h1_text": h1_text,
+            "h1_text": page_info["h1_text"],
             "page_source_length": page_info["page_source_length"],
             "url": page_info["current_url"],
             "browser_name": page_info["browser_name"],
@@ -223,30 +345,17 @@ def scrape_test_page(scraper: StandaloneChromiumScraper) -> dict[str, str]:
         }
 
         logger.info("Test page scraped successfully")
-        logger.debug(f"Scraping result: {result}")
+        # DEBUG 無効時は dict の文字列化ごと省略する
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Scraping result: %s", result)
 
         return result
 
     except Exception as e:
-        logger.error(f"Scraping failed: {e}")
+        logger.error("Scraping failed: %s", e)
         raise
 
 
 def create_scraper_from_env() -> StandaloneChromiumScraper:
-    """環境変数からスクレイパーを作成"""
-    browser = os.getenv(ENV_SELENIUM_BROWSER, DEFAULT_BROWSER)
-
-    # Railway環境の検出と適切なデフォルトURL選択
-    if os.getenv(RAILWAY_ENVIRONMENT) or os.getenv(RAILWAY_PROJECT_ID):
-        # Railway環境: Browserless.ioまたは外部サービスを使用
-        default_url = DEFAULT_REMOTE_URL_BROWSERLESS
-    elif os.getenv("DOCKER_CONTAINER"):
-        # Docker環境: selenium サービスを使用
-        default_url = DEFAULT_REMOTE_URL_DOCKER
-    else:
-        # ローカル環境: localhost を使用
-        default_url = DEFAULT_REMOTE_URL_LOCAL
-
-    remote_url = os.getenv(ENV_SELENIUM_REMOTE_URL, default_url)
-
-    return StandaloneChromiumScraper(browser=browser, remote_url=remote_url)
+    """環境変数からスクレイパーを作成 (環境変数は import 時にキャッシュ済み)"""
+    return StandaloneChromiumScraper(browser=_ENV_BROWSER, remote_url=_ENV_REMOTE_URL)
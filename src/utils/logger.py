@@ -4,38 +4,74 @@ Colored Logger Utility for Python Railway Template
 提供美しい色付きログ出力功能
 """
 
+import json
 import logging
+import os
 import sys
 
 from src.constants import (
     ANSI_BOLD,
     ANSI_GRAY,
     ANSI_RESET,
+    DEFAULT_LOG_FORMAT,
     DEFAULT_LOG_LEVEL,
+    ENV_LOG_FORMAT,
     LOG_COLORS,
     LOG_ICONS,
 )
 
+# ログ出力形式はプロセス中不変なため import 時に一度だけ判定 (レコードごとの分岐を避ける)
+_LOG_FORMAT = os.getenv(ENV_LOG_FORMAT, DEFAULT_LOG_FORMAT)
+
+
+# isatty() はシステムコールを伴い、結果はプロセス中不変なため import 時に一度だけ評価
+_STDOUT_IS_TTY = sys.stdout.isatty()
+
+# レベルごとの色付きプレフィックスは不変なため、レコードごとの組み立てを避けて事前計算
+_LEVEL_PREFIX = {level: f"{LOG_COLORS[level]}{ANSI_BOLD}{LOG_ICONS[level]} {level}{ANSI_RESET}" for level in LOG_COLORS}
+
 
 class ColoredFormatter(logging.Formatter):
     """カスタムフォーマッター - ログレベルごとに色分け"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 同一秒内のレコードはタイムスタンプ文字列を再利用する
+        self._last_ts: int = -1
+        self._last_ts_str: str = ""
+
     def format(self, record: logging.LogRecord) -> str:
         """ログレコードをフォーマット"""
-        # 色とアイコンを取得
+        # レベル名+アイコンは事前計算済みプレフィックスを引く
+        colored_level = _LEVEL_PREFIX.get(record.levelname, record.levelname)
         color = LOG_COLORS.get(record.levelname, "")
-        icon = LOG_ICONS.get(record.levelname, "")
-
-        # レベル名を色付けし、アイコンを追加
-        colored_level = f"{color}{ANSI_BOLD}{icon} {record.levelname}{ANSI_RESET}"
 
         # メッセージを色付け
         colored_message = f"{color}{record.getMessage()}{ANSI_RESET}"
 
-        # タイムスタンプを薄い色で
-        timestamp = f"{ANSI_GRAY}{self.formatTime(record, '%Y-%m-%d %H:%M:%S')}{ANSI_RESET}"
+        # タイムスタンプを薄い色で (秒単位でキャッシュ)
+        second = int(record.created)
+        if second != self._last_ts:
+            self._last_ts = second
+            self._last_ts_str = f"{ANSI_GRAY}{self.formatTime(record, '%Y-%m-%d %H:%M:%S')}{ANSI_RESET}"
+
+        return f"{self._last_ts_str} {colored_level} {colored_message}"
+
 
-        return f"{timestamp} {colored_level} {colored_message}"
+class JsonFormatter(logging.Formatter):
+    """JSON形式フォーマッター - ログ収集基盤 (Railway等) 向けにANSIなしの構造化出力"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """ログレコードを1行のJSONにフォーマット"""
+        return json.dumps(
+            {
+                "ts": record.created,
+                "lvl": record.levelname,
+                "name": record.name,
+                "msg": record.getMessage(),
+            },
+            ensure_ascii=False,
+        )
 
 
 def setup_logger(name: str = __name__, level: int = DEFAULT_LOG_LEVEL, enable_colors: bool = True) -> logging.Logger:
@@ -62,8 +98,10 @@ def setup_logger(name: str = __name__, level: int = DEFAULT_LOG_LEVEL, enable_co
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
 
-    # フォーマッター設定
-    if enable_colors and sys.stdout.isatty():  # ターミナルでのみ色付け
+    # フォーマッター設定 (形式の分岐はレコードごとではなくロガー設定時に一度だけ)
+    if _LOG_FORMAT == "json":
+        formatter = JsonFormatter()
+    elif enable_colors and _STDOUT_IS_TTY:  # ターミナルでのみ色付け
         formatter = ColoredFormatter()
     else:
         # 色なしフォーマッター
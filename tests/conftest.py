@@ -0,0 +1,73 @@
+"""
+Shared fixtures and mock templates for the test suite
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.constants import TEST_URL
+
+# Mock attribute templates are defined once at module scope so the attribute
+# set is not rebuilt inline in every test body; the mock_driver fixture below
+# applies them to the shared spec_set template after resetting it.
+DRIVER_ATTRS = {
+    "title": "Test Page",
+    "current_url": TEST_URL,
+    "page_source": "<html><body>Test content</body></html>",
+    "capabilities": {"browserName": "chrome", "browserVersion": "90.0"},
+}
+
+PAGE_SUMMARY = {
+    "title": "Test Page",
+    "url": TEST_URL,
+    "h1": "Herman Melville - Moby-Dick",
+    "len": 38,
+}
+
+# Frozen driver attribute surface: spec_set rejects attribute-name typos in
+# tests, and the single template instance avoids per-test MagicMock
+# construction — reset_mock() between tests is cheaper than rebuilding.
+_DRIVER_SPEC = [
+    "title",
+    "current_url",
+    "page_source",
+    "capabilities",
+    "get",
+    "find_element",
+    "find_elements",
+    "execute_script",
+    "save_screenshot",
+    "quit",
+]
+
+_DRIVER_TEMPLATE = MagicMock(spec_set=_DRIVER_SPEC)
+
+
+@pytest.fixture
+def mock_driver():
+    """Shared spec_set driver mock, reset and re-configured between tests"""
+    _DRIVER_TEMPLATE.reset_mock(return_value=True, side_effect=True)
+    _DRIVER_TEMPLATE.configure_mock(**DRIVER_ATTRS)
+    _DRIVER_TEMPLATE.execute_script.return_value = dict(PAGE_SUMMARY)
+    return _DRIVER_TEMPLATE
+
+
+@pytest.fixture
+def mock_logger():
+    """Plain logger mock"""
+    return MagicMock()
+
+
+@pytest.fixture(scope="module")
+def _patch_remote():
+    """Patch selenium.webdriver.Remote once per test module (entering the patch imports selenium)"""
+    with patch("selenium.webdriver.Remote") as patched:
+        yield patched
+
+
+@pytest.fixture
+def mock_remote(_patch_remote):
+    """Module-wide Remote mock, reset between tests"""
+    _patch_remote.reset_mock(return_value=True, side_effect=True)
+    return _patch_remote
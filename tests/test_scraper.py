@@ -0,0 +1,152 @@
+"""
+Tests for the Selenium scraper module
+"""
+
+import importlib
+import os
+from unittest.mock import patch
+
+import pytest
+
+import src.scraper
+from src.constants import (
+    DEFAULT_BROWSER,
+    DEFAULT_REMOTE_URL_LOCAL,
+    ENV_SELENIUM_BROWSER,
+    ENV_SELENIUM_REMOTE_URL,
+    TEST_URL,
+)
+from src.scraper import StandaloneChromiumScraper, scrape_test_page
+
+# All tests in this module are mock-only
+pytestmark = pytest.mark.unit
+
+
+class TestScraper:
+    """Scraper functionality tests"""
+
+    def test_scraper_initialization(self):
+        """Test scraper initialization with constants"""
+        scraper = StandaloneChromiumScraper()
+        assert scraper.browser == DEFAULT_BROWSER
+        assert scraper.remote_url == DEFAULT_REMOTE_URL_LOCAL
+
+    def test_scraper_custom_params(self):
+        """Test scraper with custom parameters"""
+        scraper = StandaloneChromiumScraper(browser="firefox", remote_url="http://custom:4444", timeout=20)
+        assert scraper.browser == "firefox"
+        assert scraper.remote_url == "http://custom:4444"
+        assert scraper.timeout == 20
+
+    @pytest.mark.parametrize(
+        "browser,capabilities",
+        [
+            ("chrome", {"browserName": "chrome", "browserVersion": "90.0"}),
+            ("firefox", {"browserName": "firefox", "browserVersion": "85.0"}),
+        ],
+    )
+    def test_scraper_connect(self, mock_remote, browser, capabilities, mock_driver):
+        """Test connection for each supported browser"""
+        mock_driver.capabilities = capabilities
+        mock_remote.return_value = mock_driver
+
+        scraper = StandaloneChromiumScraper(browser=browser)
+        scraper.connect()
+
+        assert scraper.driver == mock_driver
+        mock_remote.assert_called_once()
+
+    @pytest.mark.parametrize("bad_browser", ["safari", "edge", "ie"])
+    def test_scraper_unsupported_browser(self, bad_browser):
+        """Test unsupported browser raises error"""
+        scraper = StandaloneChromiumScraper(browser=bad_browser)
+        with pytest.raises(ValueError, match="Unsupported browser"):
+            scraper.connect()
+
+    def test_scraper_get_page(self, mock_remote, mock_driver):
+        """Test get_page functionality"""
+        mock_remote.return_value = mock_driver
+
+        scraper = StandaloneChromiumScraper()
+        scraper.connect()
+
+        test_url = "https://example.com"
+        scraper.get_page(test_url)
+
+        mock_driver.get.assert_called_once_with(test_url)
+
+    def test_scraper_get_page_info(self, mock_remote, mock_driver):
+        """Test get_page_info functionality"""
+        mock_remote.return_value = mock_driver
+
+        scraper = StandaloneChromiumScraper()
+        scraper.connect()
+
+        page_info = scraper.get_page_info()
+
+        assert page_info["title"] == "Test Page"
+        assert page_info["current_url"] == TEST_URL
+        assert page_info["browser_name"] == "chrome"
+        assert page_info["browser_version"] == "90.0"
+
+    @patch("src.scraper.os.makedirs")
+    def test_scraper_take_screenshot(self, mock_makedirs, mock_remote, mock_driver):
+        """Test screenshot functionality"""
+        mock_remote.return_value = mock_driver
+
+        scraper = StandaloneChromiumScraper()
+        scraper.connect()
+
+        # os.makedirs is patched, so no real directory is needed
+        filepath = scraper.take_screenshot("test.png", "/fake/dir")
+        expected_path = os.path.join("/fake/dir", "test.png")
+        assert filepath == expected_path
+        mock_driver.save_screenshot.assert_called_with(expected_path)
+
+    def test_create_scraper_from_env_defaults(self):
+        """Test creating scraper from environment variables with defaults"""
+        # Env vars are cached at import, so reload the module under the patched env
+        try:
+            with patch.dict(os.environ, {}, clear=True):
+                scraper_module = importlib.reload(src.scraper)
+                scraper = scraper_module.create_scraper_from_env()
+                assert scraper.browser == DEFAULT_BROWSER
+                assert scraper.remote_url == DEFAULT_REMOTE_URL_LOCAL
+        finally:
+            importlib.reload(src.scraper)
+
+    def test_create_scraper_from_env_custom(self):
+        """Test creating scraper from custom environment variables"""
+        test_env = {
+            ENV_SELENIUM_BROWSER: "firefox",
+            ENV_SELENIUM_REMOTE_URL: "http://test:4444",
+        }
+        try:
+            with patch.dict(os.environ, test_env, clear=True):
+                scraper_module = importlib.reload(src.scraper)
+                scraper = scraper_module.create_scraper_from_env()
+                assert scraper.browser == "firefox"
+                assert scraper.remote_url == "http://test:4444"
+        finally:
+            importlib.reload(src.scraper)
+
+
+class TestScrapingFunction:
+    """Test the external scraping function"""
+
+    def test_scrape_test_page_function(self, mock_remote, mock_driver):
+        """Test the external scrape_test_page function"""
+        mock_remote.return_value = mock_driver
+
+        scraper = StandaloneChromiumScraper()
+        scraper.connect()
+
+        # Use the external function
+        result = scrape_test_page(scraper)
+
+        assert result["status"] == "success"
+        assert result["title"] == "Test Page"
+        assert result["h1_text"] == "Herman Melville - Moby-Dick"
+        assert result["url"] == TEST_URL
+        # Verify that scraper methods were called
+        mock_driver.get.assert_called_with(TEST_URL)